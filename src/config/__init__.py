@@ -29,5 +29,7 @@ def __getattr__(name: str):
     if name == "config":
         from .accessor import config
 
+        # Bind on the module so later lookups skip __getattr__ entirely
+        globals()["config"] = config
         return config
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
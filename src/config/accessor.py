@@ -17,6 +17,9 @@ Usage:
     # Get with default (if field doesn't exist)
     value = config.get('todo.general.unknown_field', default=10)
 
+    # Get several values at once
+    values = config.get_many(['todo.general.max_todos_per_user', 'core.site.site_name'])
+
     # Get all configs for an app
     all_todo = config.all('todo')
 
@@ -24,71 +27,96 @@ Usage:
     general = config.section('todo.general')
 """
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
-from .cache import config_cache
+from django.db import transaction
+
+from .cache import (
+    NOT_FOUND,
+    UNSET,
+    cache_add_many,
+    cache_get,
+    cache_get_many,
+    cache_set,
+    cache_set_many,
+)
 from .exceptions import (
     AppNotFoundError,
     ConfigValueError,
     FieldNotFoundError,
     InvalidPathError,
 )
+from .frontend_models import SecretFrontendModel
 from .models import ConfigValue
 from .registry import Field, config_registry
 
 
-class ConfigAccessor:
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> tuple[str, str, str]:
     """
-    Configuration accessor using dot notation paths.
+    Parse a dot-notation path into (app_label, section, field).
 
-    All paths follow the format: `app.section.field`
-    Examples:
-        - todo.general.max_todos_per_user
-        - core.site.site_name
-        - core.api.rate_limit
+    Results are memoized since config paths are a small set of literal
+    strings that are parsed on every lookup. Invalid paths raise before
+    anything is cached.
+
+    Args:
+        path: Full path like 'todo.general.max_todos_per_user'
+
+    Returns:
+        Tuple of (app_label, section, field)
+
+    Raises:
+        InvalidPathError: If path doesn't have exactly 3 parts
     """
+    app_label, dot1, rest = path.partition(".")
+    section, dot2, field = rest.partition(".")
+    if not (dot1 and dot2) or "." in field:
+        raise InvalidPathError(
+            path,
+            f"Invalid path '{path}'. Expected format: app.section.field",
+        )
+    return app_label, section, field
 
-    def _parse_path(self, path: str) -> tuple[str, str, str]:
-        """
-        Parse a dot-notation path into (app_label, section, field).
 
-        Args:
-            path: Full path like 'todo.general.max_todos_per_user'
+@lru_cache(maxsize=1024)
+def _parse_app_section(path: str) -> tuple[str, str]:
+    """
+    Parse a path into (app_label, section).
 
-        Returns:
-            Tuple of (app_label, section, field)
+    Args:
+        path: Path like 'todo.general'
 
-        Raises:
-            InvalidPathError: If path doesn't have exactly 3 parts
-        """
-        parts = path.split(".")
-        if len(parts) != 3:
-            raise InvalidPathError(
-                path,
-                f"Invalid path '{path}'. Expected format: app.section.field",
-            )
-        return parts[0], parts[1], parts[2]
+    Returns:
+        Tuple of (app_label, section)
 
-    def _parse_app_section(self, path: str) -> tuple[str, str]:
-        """
-        Parse a path into (app_label, section).
+    Raises:
+        InvalidPathError: If path doesn't have exactly 2 parts
+    """
+    app_label, dot, section = path.partition(".")
+    if not dot or "." in section:
+        raise InvalidPathError(
+            path,
+            f"Invalid path '{path}'. Expected format: app.section",
+        )
+    return app_label, section
 
-        Args:
-            path: Path like 'todo.general'
 
-        Returns:
-            Tuple of (app_label, section)
+class ConfigAccessor:
+    """
+    Configuration accessor using dot notation paths.
 
-        Raises:
-            InvalidPathError: If path doesn't have exactly 2 parts
-        """
-        parts = path.split(".")
-        if len(parts) != 2:
-            raise InvalidPathError(
-                path,
-                f"Invalid path '{path}'. Expected format: app.section",
-            )
-        return parts[0], parts[1]
+    All paths follow the format: `app.section.field`
+    Examples:
+        - todo.general.max_todos_per_user
+        - core.site.site_name
+        - core.api.rate_limit
+    """
+
+    # Stateless - no per-instance __dict__
+    __slots__ = ()
 
     def _get_field(self, app_label: str, section: str, field: str) -> Field:
         """
@@ -102,9 +130,7 @@ class ConfigAccessor:
         if not config_def:
             raise AppNotFoundError(app_label)
 
-        # Registry uses slash notation internally
-        registry_path = f"{section}/{field}"
-        field_def = config_def.get_field(registry_path)
+        field_def = config_def.get_section_field(section, field)
         if not field_def:
             raise FieldNotFoundError(f"{app_label}.{section}.{field}")
 
@@ -120,18 +146,68 @@ class ConfigAccessor:
             return field.default
 
         # Special handling for SecretFrontendModel - decrypt the value
-        from .frontend_models import SecretFrontendModel
-
         if field.frontend_model is SecretFrontendModel:
             return SecretFrontendModel.decrypt_value(raw_value)
 
-        frontend_model = field.get_frontend_model_instance(raw_value)
-        return frontend_model.get_value(raw_value)
+        return field.shared_frontend_model.get_value(raw_value)
 
     def _serialize(self, field: Field, value: Any) -> str | None:
         """Serialize a value for database storage using the field's frontend model."""
-        frontend_model = field.get_frontend_model_instance(value)
-        return frontend_model.serialize_value(value)
+        return field.shared_frontend_model.serialize_value(value)
+
+    def _to_cache_value(self, field: Field, raw_value: str | None) -> Any:
+        """
+        Convert a raw database value into the form stored in the cache.
+
+        Values are cached already deserialized so cache hits skip the
+        frontend model entirely. Secrets are the exception: they stay
+        encrypted in the cache and are decrypted on read.
+        """
+        if raw_value is None:
+            return UNSET
+        if field.frontend_model is SecretFrontendModel:
+            return raw_value
+        return self._deserialize(field, raw_value)
+
+    def _from_cache_value(self, field: Field, cached_value: Any, default: Any) -> Any:
+        """Convert a cached value back into the typed configuration value."""
+        if cached_value is UNSET:
+            return field.default if field.default is not None else default
+        if field.frontend_model is SecretFrontendModel:
+            return SecretFrontendModel.decrypt_value(cached_value)
+        return cached_value
+
+    def _load_app_cache(self, app_label: str) -> dict[str, Any]:
+        """
+        Load every value for an app into the cache with a single query.
+
+        Fields without a stored value are cached too, to avoid repeated
+        DB queries. Keys that are already cached are left as they are.
+
+        Writing the values back takes one cache add per field of the app,
+        so a cold miss costs as many cache round-trips as the app has
+        fields; after that, reads of any of its fields are cache hits.
+
+        Returns:
+            Dict mapping full paths to the values loaded from the DB
+        """
+        config_def = config_registry.get_config(app_label)
+        stored = dict(
+            ConfigValue.objects.filter(app_label=app_label).values_list("path", "value")
+        )
+
+        loaded = {}
+        for _, _, fields in config_def.section_fields:
+            for _, field, db_path in fields:
+                raw_value = stored.get(db_path)
+                loaded[f"{app_label}.{db_path}"] = self._to_cache_value(
+                    field, raw_value
+                )
+
+        # Never overwrite: a concurrent set() may have cached a newer value
+        # after the query above ran
+        cache_add_many(loaded)
+        return loaded
 
     def get(self, path: str, default: Any = None) -> Any:
         """
@@ -153,7 +229,7 @@ class ConfigAccessor:
             FieldNotFoundError: If field doesn't exist (only if no default)
         """
         try:
-            app_label, section, field_name = self._parse_path(path)
+            app_label, section, field_name = _parse_path(path)
             field = self._get_field(app_label, section, field_name)
         except (InvalidPathError, AppNotFoundError, FieldNotFoundError):
             if default is not None:
@@ -161,33 +237,71 @@ class ConfigAccessor:
             raise
 
         # First check cache
-        cached_value = config_cache.get(path)
-        if cached_value is not config_cache.NOT_FOUND:
-            # Cache hit - deserialize the raw value
-            return self._deserialize(field, cached_value)
+        cached_value = cache_get(path)
+        if cached_value is NOT_FOUND:
+            # Cache miss - load the whole app so reads of its other fields
+            # are served from cache too
+            cached_value = self._load_app_cache(app_label)[path]
 
-        # Cache miss - query database
-        db_path = self._to_db_path(section, field_name)
+        return self._from_cache_value(field, cached_value, default)
 
-        try:
-            config_value = ConfigValue.objects.get(
-                app_label=app_label,
-                path=db_path,
+    def get_many(self, paths: list[str]) -> dict[str, Any]:
+        """
+        Get several configuration values at once.
+
+        Cached values are fetched in a single cache round-trip and misses
+        are loaded with one query per app. Each miss is then written back
+        with its own cache add (one round-trip per missed path), so a cold
+        cache costs more than a warm one.
+
+        Args:
+            paths: Full paths like 'todo.general.max_todos_per_user'
+
+        Returns:
+            Dict mapping each path to its typed configuration value
+
+        Raises:
+            InvalidPathError: If a path format is invalid
+            AppNotFoundError: If an app has no registered config
+            FieldNotFoundError: If a field doesn't exist
+        """
+        resolved = {}
+        for path in paths:
+            app_label, section, field_name = _parse_path(path)
+            field = self._get_field(app_label, section, field_name)
+            resolved[path] = (app_label, self._to_db_path(section, field_name), field)
+
+        cached_values = cache_get_many(list(resolved))
+
+        # Group cache misses by app so each app needs a single query
+        misses_by_app = defaultdict(dict)
+        for path, (app_label, db_path, _) in resolved.items():
+            if path not in cached_values:
+                misses_by_app[app_label][db_path] = path
+
+        loaded = {}
+        for app_label, misses in misses_by_app.items():
+            stored = dict(
+                ConfigValue.objects.filter(
+                    app_label=app_label, path__in=misses
+                ).values_list("path", "value")
             )
-            # Cache the raw database value
-            config_cache.set(path, config_value.value)
-            return self._deserialize(field, config_value.value)
-        except ConfigValue.DoesNotExist:
-            # No DB value - use default and cache it
-            if field.default is not None:
-                # Serialize and cache the default value
-                frontend_model = field.get_frontend_model_instance()
-                serialized_default = frontend_model.serialize_value(field.default)
-                config_cache.set(path, serialized_default)
-                return field.default
-            # No default - cache None to avoid repeated DB queries
-            config_cache.set(path, None)
-            return default
+            for db_path, path in misses.items():
+                field = resolved[path][2]
+                loaded[path] = self._to_cache_value(field, stored.get(db_path))
+
+        if loaded:
+            cached_values.update(loaded)
+            # Never overwrite: a concurrent set() may have cached a newer
+            # value after the query above ran, so prefer what it cached
+            lost = cache_add_many(loaded)
+            if lost:
+                cached_values.update(cache_get_many(lost))
+
+        return {
+            path: self._from_cache_value(field, cached_values[path], None)
+            for path, (_, _, field) in resolved.items()
+        }
 
     def set(self, path: str, value: Any) -> None:
         """
@@ -206,7 +320,7 @@ class ConfigAccessor:
             FieldNotFoundError: If field doesn't exist
             ConfigValueError: If value cannot be serialized
         """
-        app_label, section, field_name = self._parse_path(path)
+        app_label, section, field_name = _parse_path(path)
         field = self._get_field(app_label, section, field_name)
 
         try:
@@ -216,31 +330,27 @@ class ConfigAccessor:
 
         db_path = self._to_db_path(section, field_name)
 
-        # Get old value before saving (for on_save callback)
-        old_value = None
-        if field.on_save:
-            try:
-                existing = ConfigValue.objects.get(app_label=app_label, path=db_path)
-                old_value = self._deserialize(field, existing.value)
-            except ConfigValue.DoesNotExist:
-                old_value = field.default
-
-        # Save to database
-        ConfigValue.objects.update_or_create(
-            app_label=app_label,
-            path=db_path,
-            defaults={"value": serialized},
-        )
-
-        # Invalidate cache after successful DB save
-        config_cache.invalidate(path)
+        # Save to database, reading the old value (for on_save callback)
+        # under the same row lock instead of with a separate query
+        with transaction.atomic():
+            locked = ConfigValue.objects.select_for_update()
+            config_value, created = locked.get_or_create(
+                app_label=app_label,
+                path=db_path,
+                defaults={"value": serialized},
+            )
+            old_raw_value = None if created else config_value.value
+            if not created:
+                config_value.value = serialized
+                config_value.save(update_fields=["value"])
 
-        # Cache the new value immediately to avoid cache miss on next read
-        config_cache.set(path, serialized)
+        # Replace the cached value after the successful DB save (no delete
+        # first, so readers never see a miss they'd fill from the DB)
+        cache_set(path, self._to_cache_value(field, serialized))
 
-        # Call on_save callback if defined
+        # Call on_save callback if defined (a missing row means the default)
         if field.on_save:
-            field.on_save(path, value, old_value)
+            field.on_save(path, value, self._deserialize(field, old_raw_value))
 
     def set_many(self, values: dict[str, Any]) -> int:
         """
@@ -255,11 +365,66 @@ class ConfigAccessor:
         Raises:
             InvalidPathError, AppNotFoundError, FieldNotFoundError, ConfigValueError
         """
-        count = 0
+        # Resolve and serialize everything first so nothing is written on error
+        entries = []
         for path, value in values.items():
-            self.set(path, value)
-            count += 1
-        return count
+            app_label, section, field_name = _parse_path(path)
+            field = self._get_field(app_label, section, field_name)
+            try:
+                serialized = self._serialize(field, value)
+            except Exception as e:
+                raise ConfigValueError(path, value, str(e)) from e
+            db_path = self._to_db_path(section, field_name)
+            entries.append((path, app_label, db_path, field, value, serialized))
+
+        if not entries:
+            return 0
+
+        # Only fields with on_save callbacks need their old values
+        paths_by_app = defaultdict(list)
+        for _, app_label, db_path, field, _, _ in entries:
+            if field.on_save:
+                paths_by_app[app_label].append(db_path)
+
+        old_raw_values = {}
+        with transaction.atomic():
+            # Read old values (for on_save callbacks) under row locks, one
+            # query per app, so they can't change before the upsert below
+            for app_label, db_paths in paths_by_app.items():
+                rows = (
+                    ConfigValue.objects.select_for_update()
+                    .filter(app_label=app_label, path__in=db_paths)
+                    .values_list("path", "value")
+                )
+                for db_path, raw_value in rows:
+                    old_raw_values[(app_label, db_path)] = raw_value
+
+            # Save to database as a single upsert
+            ConfigValue.objects.bulk_create(
+                [
+                    ConfigValue(app_label=app_label, path=db_path, value=serialized)
+                    for _, app_label, db_path, _, _, serialized in entries
+                ],
+                update_conflicts=True,
+                unique_fields=["app_label", "path"],
+                update_fields=["value"],
+            )
+
+        # Refresh the cache with the new values in one round-trip
+        cache_set_many(
+            {
+                path: self._to_cache_value(field, serialized)
+                for path, _, _, field, _, serialized in entries
+            }
+        )
+
+        # Call on_save callbacks once everything is saved
+        for path, app_label, db_path, field, value, _ in entries:
+            if field.on_save:
+                old_raw = old_raw_values.get((app_label, db_path))
+                field.on_save(path, value, self._deserialize(field, old_raw))
+
+        return len(entries)
 
     def all(self, app_label: str) -> dict[str, dict[str, Any]]:
         """
@@ -279,17 +444,15 @@ class ConfigAccessor:
             raise AppNotFoundError(app_label)
 
         # Fetch all stored values
-        stored = {
-            cv.path: cv.value for cv in ConfigValue.objects.filter(app_label=app_label)
-        }
+        stored = dict(
+            ConfigValue.objects.filter(app_label=app_label).values_list("path", "value")
+        )
 
         result = {}
-        for section_name, section_class in config_def.get_sections():
-            section_key = section_name.lower()
+        for section_key, _, fields in config_def.section_fields:
             section_data = {}
 
-            for field_name, field in section_class.get_fields().items():
-                db_path = self._to_db_path(section_key, field_name)
+            for field_name, field, db_path in fields:
                 raw_value = stored.get(db_path)
                 section_data[field_name] = self._deserialize(field, raw_value)
 
@@ -311,7 +474,7 @@ class ConfigAccessor:
             InvalidPathError: If path format is invalid
             AppNotFoundError: If app has no registered config
         """
-        app_label, section = self._parse_app_section(path)
+        app_label, section = _parse_app_section(path)
         all_config = self.all(app_label)
         return all_config.get(section.lower(), {})
 
@@ -326,7 +489,7 @@ class ConfigAccessor:
             True if the field is registered, False otherwise
         """
         try:
-            app_label, section, field_name = self._parse_path(path)
+            app_label, section, field_name = _parse_path(path)
             self._get_field(app_label, section, field_name)
             return True
         except (InvalidPathError, AppNotFoundError, FieldNotFoundError):
@@ -343,7 +506,7 @@ class ConfigAccessor:
             True if value exists in database, False if using default
         """
         try:
-            app_label, section, field_name = self._parse_path(path)
+            app_label, section, field_name = _parse_path(path)
         except InvalidPathError:
             return False
 
@@ -1,9 +1,9 @@
 from django.contrib import admin
 
+from .encryption import AESGCM_TOKEN_PREFIX, FERNET_TOKEN_PREFIX
 from .models import ConfigValue
 
 # Constants for value preview display
-FERNET_TOKEN_PREFIX = "gAAAAA"  # All Fernet tokens start with this
 SECRET_VALUE_MIN_LENGTH = 50  # Values longer than this are likely encrypted
 PREVIEW_MAX_LENGTH = 100  # Maximum length for value preview
 
@@ -18,19 +18,21 @@ class ConfigValueAdmin(admin.ModelAdmin):
     ordering = ("app_label", "path")
     readonly_fields = ("app_label", "path", "value_preview")
 
+    @admin.display(description="Value")
     def value_preview(self, obj):
         """Show value preview, masking secrets."""
-        if not obj.value:
+        value = obj.value
+        if not value:
             return "(empty)"
-        # Mask potentially encrypted/secret values (they start with 'gAAAAA' for Fernet)
+        length = len(value)
+        # Mask potentially encrypted/secret values (they start with 'gAAAAA' for
+        # legacy Fernet tokens or 'aesgcm$' for AES-GCM values)
         if (
-            obj.value.startswith(FERNET_TOKEN_PREFIX)
-            or len(obj.value) > SECRET_VALUE_MIN_LENGTH
+            value.startswith((FERNET_TOKEN_PREFIX, AESGCM_TOKEN_PREFIX))
+            or length > SECRET_VALUE_MIN_LENGTH
         ):
             return "*** (encrypted/secret value hidden) ***"
         # Truncate long values
-        if len(obj.value) > PREVIEW_MAX_LENGTH:
-            return obj.value[:PREVIEW_MAX_LENGTH] + "..."
-        return obj.value
-
-    value_preview.short_description = "Value"
+        if length > PREVIEW_MAX_LENGTH:
+            return value[:PREVIEW_MAX_LENGTH] + "..."
+        return value
@@ -2,12 +2,105 @@ from typing import Any, Self
 
 from django.core.cache import cache
 
+# Versioned because entries hold deserialized values (and the UNSET marker);
+# entries written under the old "config:" prefix held raw serialized strings
+# and never expire, so they must not be read back as typed values
+CACHE_KEY_PREFIX = "config:v2:"
+# Sentinel value to distinguish between "key doesn't exist" and "value is None"
+NOT_FOUND = object()
+
+
+class _Unset:
+    """Marker cached for config paths that have no stored value."""
+
+    def __reduce__(self):
+        # Pickle by reference so the marker survives a round-trip through
+        # the cache backend and can still be compared by identity
+        return "UNSET"
+
+    def __repr__(self):
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+
+def cache_get(key: str) -> Any:
+    """
+    Get value from cache.
+
+    Returns:
+        Cached value if exists, NOT_FOUND sentinel if key doesn't exist
+    """
+    return cache.get(f"{CACHE_KEY_PREFIX}{key}", NOT_FOUND)
+
+
+def cache_set(key: str, value: Any) -> None:
+    """Set value in cache with no expiration (invalidate only on change)."""
+    cache.set(f"{CACHE_KEY_PREFIX}{key}", value, timeout=None)
+
+
+def cache_add(key: str, value: Any) -> bool:
+    """
+    Set value in cache only if the key isn't already set (no expiration).
+
+    Returns:
+        True if the value was stored
+    """
+    return cache.add(f"{CACHE_KEY_PREFIX}{key}", value, timeout=None)
+
+
+def cache_add_many(values: dict[str, Any]) -> list[str]:
+    """
+    Set several values in cache, skipping keys that are already set.
+
+    Django's cache API has no batched add, so this costs one cache
+    round-trip per key.
+
+    Returns:
+        Keys that were not stored because they were already set
+    """
+    return [key for key, value in values.items() if not cache_add(key, value)]
+
+
+def cache_get_many(keys: list[str]) -> dict[str, Any]:
+    """
+    Get several values from cache in a single round-trip.
+
+    Returns:
+        Dict of the keys that exist in cache and their values
+    """
+    full_keys = {f"{CACHE_KEY_PREFIX}{key}": key for key in keys}
+    found = cache.get_many(full_keys)
+    return {full_keys[full_key]: value for full_key, value in found.items()}
+
+
+def cache_set_many(values: dict[str, Any]) -> None:
+    """Set several values in cache in a single round-trip (no expiration)."""
+    cache.set_many(
+        {f"{CACHE_KEY_PREFIX}{key}": value for key, value in values.items()},
+        timeout=None,
+    )
+
+
+def cache_invalidate(key: str) -> None:
+    """Invalidate (delete) a cache key."""
+    cache.delete(f"{CACHE_KEY_PREFIX}{key}")
+
 
 class ConfigCache:
-    CACHE_KEY_PREFIX = "config:"
-    # Sentinel value to distinguish between "key doesn't exist" and "value is None"
-    # Made a class attribute for public access
-    NOT_FOUND = object()
+    """
+    Object wrapper around the module-level cache functions.
+
+    Kept for backwards compatibility; new code should call the module-level
+    functions directly.
+    """
+
+    CACHE_KEY_PREFIX = CACHE_KEY_PREFIX
+    # Made class attributes for public access
+    NOT_FOUND = NOT_FOUND
+    # Cached value for a path that is known to have no stored value
+    UNSET = UNSET
 
     _instance: Self | None = None
 
@@ -23,22 +116,19 @@ class ConfigCache:
         Returns:
             Cached value if exists, NOT_FOUND sentinel if key doesn't exist
         """
-        full_key = self.CACHE_KEY_PREFIX + key
-        # Use a sentinel to distinguish between "key doesn't exist" and "value is None"
-        value = cache.get(full_key, self.NOT_FOUND)
-        return value
+        return cache_get(key)
 
     def exists(self, key: str) -> bool:
         """Check if a key exists in cache."""
-        return self.get(key) is not self.NOT_FOUND
+        return cache_get(key) is not NOT_FOUND
 
     def set(self, key: str, value: Any) -> None:
         """Set value in cache with no expiration (invalidate only on change)."""
-        cache.set(self.CACHE_KEY_PREFIX + key, value, timeout=None)
+        cache_set(key, value)
 
     def invalidate(self, key: str) -> None:
         """Invalidate (delete) a cache key."""
-        cache.delete(self.CACHE_KEY_PREFIX + key)
+        cache_invalidate(key)
 
 
 # Singleton instance
@@ -1,18 +1,30 @@
 """
 Encryption utilities for sensitive configuration values.
 
-Uses Fernet symmetric encryption (AES-128-CBC + HMAC) with a key
-derived from Django's SECRET_KEY.
+New values are encrypted with AES-256-GCM using a key derived from Django's
+SECRET_KEY. Values written by earlier versions use Fernet (AES-128-CBC + HMAC)
+and remain readable.
 """
 
 import base64
 import hashlib
+import os
+from functools import lru_cache
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from django.conf import settings
 
-# Minimum size of a Fernet token in bytes (version + timestamp + IV + ciphertext + HMAC)
-MIN_FERNET_TOKEN_SIZE = 57
+# All Fernet tokens start with this (version byte + zeroed timestamp high bytes)
+FERNET_TOKEN_PREFIX = "gAAAAA"
+# Minimum length of a base64-encoded Fernet token
+# (version + timestamp + IV + one ciphertext block + HMAC = 73 bytes)
+MIN_FERNET_TOKEN_LENGTH = 100
+
+# Prefix marking values encrypted with AES-GCM (followed by base64 nonce + ciphertext)
+AESGCM_TOKEN_PREFIX = "aesgcm$"
+AESGCM_NONCE_SIZE = 12
 
 
 def _get_fernet() -> Fernet:
@@ -22,10 +34,38 @@ def _get_fernet() -> Fernet:
     The key is derived using SHA-256 to ensure a consistent 32-byte key
     regardless of the SECRET_KEY length.
     """
-    key = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+    return _get_fernet_for_key(settings.SECRET_KEY)
+
+
+@lru_cache(maxsize=1)
+def _get_fernet_for_key(secret_key: str) -> Fernet:
+    """
+    Build the Fernet instance for a given secret key.
+
+    Memoized so key derivation runs once per process; keying on the secret
+    means a changed SECRET_KEY (e.g. via override_settings) still takes effect.
+    """
+    key = hashlib.sha256(secret_key.encode()).digest()
     return Fernet(base64.urlsafe_b64encode(key))
 
 
+def _get_aesgcm() -> AESGCM:
+    """Get an AES-GCM cipher with a key derived from Django's SECRET_KEY."""
+    return _get_aesgcm_for_key(settings.SECRET_KEY)
+
+
+@lru_cache(maxsize=1)
+def _get_aesgcm_for_key(secret_key: str) -> AESGCM:
+    """
+    Build the AES-GCM cipher for a given secret key.
+
+    The key is domain-separated from the Fernet key so the two schemes never
+    share key material.
+    """
+    key = hashlib.sha256(secret_key.encode() + b":aesgcm").digest()
+    return AESGCM(key)
+
+
 def encrypt(value: str) -> str:
     """
     Encrypt a string value.
@@ -34,18 +74,22 @@ def encrypt(value: str) -> str:
         value: The plaintext string to encrypt
 
     Returns:
-        The encrypted value as a base64-encoded string
+        The encrypted value as a prefixed base64-encoded string
     """
     if not value:
         return ""
-    fernet = _get_fernet()
-    return fernet.encrypt(value.encode()).decode()
+    nonce = os.urandom(AESGCM_NONCE_SIZE)
+    ciphertext = _get_aesgcm().encrypt(nonce, value.encode(), None)
+    token = base64.urlsafe_b64encode(nonce + ciphertext).decode()
+    return AESGCM_TOKEN_PREFIX + token
 
 
 def decrypt(encrypted_value: str) -> str:
     """
     Decrypt an encrypted string value.
 
+    Both AES-GCM values and legacy Fernet tokens are supported.
+
     Args:
         encrypted_value: The encrypted base64-encoded string
 
@@ -57,32 +101,38 @@ def decrypt(encrypted_value: str) -> str:
     """
     if not encrypted_value:
         return ""
-    fernet = _get_fernet()
-    return fernet.decrypt(encrypted_value.encode()).decode()
+    if not encrypted_value.startswith(AESGCM_TOKEN_PREFIX):
+        fernet = _get_fernet()
+        return fernet.decrypt(encrypted_value.encode()).decode()
+
+    data = base64.urlsafe_b64decode(encrypted_value[len(AESGCM_TOKEN_PREFIX) :])
+    nonce, ciphertext = data[:AESGCM_NONCE_SIZE], data[AESGCM_NONCE_SIZE:]
+    try:
+        return _get_aesgcm().decrypt(nonce, ciphertext, None).decode()
+    except InvalidTag:
+        raise InvalidToken from None
 
 
 def is_encrypted(value: str) -> bool:
     """
     Check if a value appears to be encrypted.
 
-    This is a heuristic check - Fernet tokens have a specific format.
+    This is a heuristic check based on the token prefixes, so it never
+    needs to decode the value.
 
     Args:
         value: The value to check
 
     Returns:
-        True if the value looks like a Fernet token
+        True if the value looks like an AES-GCM value or a Fernet token
     """
     if not value:
         return False
-    try:
-        # Fernet tokens are base64-encoded and start with 'gAAAAA'
-        # They also have a specific length pattern
-        decoded = base64.urlsafe_b64decode(value.encode())
-        return len(decoded) >= MIN_FERNET_TOKEN_SIZE
-    except (ValueError, TypeError, UnicodeDecodeError):
-        # Invalid base64 or encoding issues mean it's not encrypted
-        return False
+    if value.startswith(AESGCM_TOKEN_PREFIX):
+        return True
+    return (
+        value.startswith(FERNET_TOKEN_PREFIX) and len(value) >= MIN_FERNET_TOKEN_LENGTH
+    )
 
 
 def safe_decrypt(encrypted_value: str, default: str = "") -> str:
@@ -10,16 +10,33 @@ These classes bind configuration fields to their input components and handle:
 - Extracting and converting values from POST requests
 """
 
-from abc import ABC, abstractmethod
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
-from django.template.loader import render_to_string
+from django.template import Context, engines
 
+from .encryption import encrypt, safe_decrypt
 
-class BaseFrontendModel(ABC):
+# Lowercase string values treated as True by BooleanFrontendModel
+TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+
+def _get_template(template_name: str):
+    """
+    Get a compiled frontend model template.
+
+    Always resolved through the Django engine: frontend model templates live
+    on disk, and render() relies on the DjangoTemplates wrapper's .template.
+    Skipping the other engines also keeps the database-backed email engine
+    out of every render; the Django engine's cached loader keeps the compiled
+    template and resets it when the autoreloader sees a template change.
+    """
+    return engines["django"].get_template(template_name)
+
+
+class BaseFrontendModel:
     """
-    Abstract base class for all frontend models.
+    Base class for all frontend models.
 
     Each frontend model is responsible for rendering an input component
     and extracting the submitted value from the request.
@@ -40,26 +57,37 @@ class BaseFrontendModel(ABC):
 
     def get_context(self) -> dict:
         """Get the template context for rendering."""
+        field = self.field
         return {
-            "field": self.field,
+            "field": field,
             "value": self.current_value,
-            "input_name": self.get_input_name(),
-            "input_id": self.get_input_id(),
+            "input_name": field.input_name,
+            "input_id": field.input_id,
         }
 
     def get_input_name(self) -> str:
         """Get the HTML input name attribute."""
-        return f"config_{self.field.path.replace('/', '_')}"
+        return self.field.input_name
 
     def get_input_id(self) -> str:
         """Get the HTML input id attribute."""
-        return f"id_{self.get_input_name()}"
+        return self.field.input_id
 
-    def render(self) -> str:
-        """Render the input component as HTML."""
-        return render_to_string(self.template_name, self.get_context())
+    def render(self, context: Context | None = None) -> str:
+        """
+        Render the input component as HTML.
+
+        Args:
+            context: Optional Context shared across several renders. The
+                    field's context is pushed onto it for this render only,
+                    so one Context can serve every field on a page.
+        """
+        template = _get_template(self.template_name)
+        if context is None:
+            return template.render(self.get_context())
+        with context.push(self.get_context()):
+            return template.template.render(context)
 
-    @abstractmethod
     def get_value(self, raw_value: str | None) -> Any:
         """
         Convert the raw form value to the appropriate Python type.
@@ -70,7 +98,7 @@ class BaseFrontendModel(ABC):
         Returns:
             The converted value in the appropriate type
         """
-        pass
+        raise NotImplementedError
 
     def serialize_value(self, value: Any) -> str | None:
         """
@@ -125,6 +153,9 @@ class IntegerFrontendModel(BaseFrontendModel):
     def serialize_value(self, value: Any) -> str | None:
         if value is None:
             return None
+        # Already an int (exact class, so bools still go through int())
+        if value.__class__ is int:
+            return str(value)
         return str(int(value))
 
 
@@ -134,10 +165,15 @@ class DecimalFrontendModel(BaseFrontendModel):
     template_name = "config/frontend_models/decimal.html"
 
     def get_context(self) -> dict:
-        context = super().get_context()
-        # Allow customizing decimal places via field extra
-        context["step"] = self.field.extra.get("step", "0.01")
-        return context
+        field = self.field
+        return {
+            "field": field,
+            "value": self.current_value,
+            "input_name": field.input_name,
+            "input_id": field.input_id,
+            # Allow customizing decimal places via field extra
+            "step": field.extra.get("step", "0.01"),
+        }
 
     def get_value(self, raw_value: str | None) -> Decimal | None:
         if raw_value is None or raw_value == "":
@@ -150,6 +186,9 @@ class DecimalFrontendModel(BaseFrontendModel):
     def serialize_value(self, value: Any) -> str | None:
         if value is None:
             return None
+        # Already a Decimal (or subclass) - no need to construct a new one
+        if isinstance(value, Decimal):
+            return str(value)
         return str(Decimal(value))
 
 
@@ -159,19 +198,26 @@ class BooleanFrontendModel(BaseFrontendModel):
     template_name = "config/frontend_models/boolean.html"
 
     def get_context(self) -> dict:
-        context = super().get_context()
-        # Convert value to boolean for template
-        context["checked"] = self._to_bool(self.current_value)
-        return context
+        field = self.field
+        return {
+            "field": field,
+            "value": self.current_value,
+            "input_name": field.input_name,
+            "input_id": field.input_id,
+            # Convert value to boolean for template
+            "checked": self._to_bool(self.current_value),
+        }
 
     def _to_bool(self, value: Any) -> bool:
         """Convert various value representations to boolean."""
+        # bool can't be subclassed, so an identity check on the class is exact
+        if value.__class__ is bool:
+            return value
         if value is None:
             return False
-        if isinstance(value, bool):
-            return value
         if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes", "on")
+            # Stored values are already lowercase, so try them before lowering
+            return value in TRUE_STRINGS or value.lower() in TRUE_STRINGS
         return bool(value)
 
     def get_value(self, raw_value: str | None) -> bool:
@@ -201,11 +247,16 @@ class SelectFrontendModel(BaseFrontendModel):
     template_name = "config/frontend_models/select.html"
 
     def get_context(self) -> dict:
-        context = super().get_context()
-        # Choices should be provided via field.extra['choices']
-        # Format: [('value', 'Label'), ...]
-        context["choices"] = self.field.extra.get("choices", [])
-        return context
+        field = self.field
+        return {
+            "field": field,
+            "value": self.current_value,
+            "input_name": field.input_name,
+            "input_id": field.input_id,
+            # Choices should be provided via field.extra['choices']
+            # Format: [('value', 'Label'), ...]
+            "choices": field.extra.get("choices", []),
+        }
 
     def get_value(self, raw_value: str | None) -> str | None:
         if raw_value is None or raw_value == "":
@@ -229,16 +280,18 @@ class SecretFrontendModel(BaseFrontendModel):
     SECRET_PLACEHOLDER = "••••••••••••••••••••••••"
 
     def get_context(self) -> dict:
-        context = super().get_context()
-        # Never send the actual value to the template
-        # Just indicate whether a value exists
-        context["has_value"] = (
-            self.current_value is not None and self.current_value != ""
-        )
-        context["placeholder"] = self.SECRET_PLACEHOLDER
-        # Remove the actual value from context
-        context["value"] = ""
-        return context
+        field = self.field
+        current_value = self.current_value
+        return {
+            "field": field,
+            # Never send the actual value to the template
+            "value": "",
+            "input_name": field.input_name,
+            "input_id": field.input_id,
+            # Just indicate whether a value exists
+            "has_value": current_value is not None and current_value != "",
+            "placeholder": self.SECRET_PLACEHOLDER,
+        }
 
     def get_value(self, raw_value: str | None) -> str | None:
         """
@@ -258,8 +311,6 @@ class SecretFrontendModel(BaseFrontendModel):
         if value is None or value == "":
             return None
 
-        from .encryption import encrypt
-
         return encrypt(str(value))
 
     @staticmethod
@@ -273,8 +324,6 @@ class SecretFrontendModel(BaseFrontendModel):
         if encrypted_value is None or encrypted_value == "":
             return None
 
-        from .encryption import safe_decrypt
-
         return safe_decrypt(encrypted_value) or None
 
 
@@ -312,8 +361,11 @@ def get_frontend_model(
     Returns:
         An instance of the appropriate BaseFrontendModel subclass
     """
-    model_class = FRONTEND_MODEL_REGISTRY.get(
-        frontend_model_name.lower(),
-        StringFrontendModel,  # Default to string
-    )
+    # Registry keys are lowercase; only normalize names that miss
+    model_class = FRONTEND_MODEL_REGISTRY.get(frontend_model_name)
+    if model_class is None:
+        model_class = FRONTEND_MODEL_REGISTRY.get(
+            frontend_model_name.lower(),
+            StringFrontendModel,  # Default to string
+        )
     return model_class(field, current_value)
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="configvalue",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="configvalue",
+            constraint=models.UniqueConstraint(
+                fields=("app_label", "path"), name="uq_config_app_path"
+            ),
+        ),
+    ]
@@ -25,7 +25,13 @@ class ConfigValue(models.Model):
     )
 
     class Meta:
-        unique_together = ("app_label", "path")
+        # Backed by a composite unique index, so (app_label, path) lookups
+        # are a single index seek and bulk upserts can target it
+        constraints = [
+            models.UniqueConstraint(
+                fields=["app_label", "path"], name="uq_config_app_path"
+            ),
+        ]
         verbose_name = "Configuration Value"
         verbose_name_plural = "Configuration Values"
         ordering = ["app_label", "path"]
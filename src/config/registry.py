@@ -26,7 +26,10 @@ Usage:
             )
 """
 
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Mapping
+from functools import cached_property
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import django.db
@@ -85,11 +88,19 @@ class Field:
 
         # These will be set by the registry during registration
         self.name: str = ""
+        self.section_key: str = ""
         self.path: str = ""
+        self.db_path: str = ""
+        self.input_name: str = ""
+        self.input_id: str = ""
 
-    @property
+    @cached_property
     def required(self) -> bool:
-        """Check if this field has a NotEmptyValidator (i.e., is required)."""
+        """
+        Check if this field has a NotEmptyValidator (i.e., is required).
+
+        Computed on first access; templates read it once per rendered field.
+        """
         from config.validators import NotEmptyValidator
 
         return any(isinstance(v, NotEmptyValidator) for v in self.validators)
@@ -100,6 +111,17 @@ class Field:
         """Create an instance of the frontend model for this field."""
         return self.frontend_model(self, current_value)
 
+    @cached_property
+    def shared_frontend_model(self) -> "BaseFrontendModel":
+        """
+        Frontend model instance shared for value conversion.
+
+        get_value() and serialize_value() don't depend on the current value,
+        so a single instance per field is reused instead of creating one per
+        conversion. Use get_frontend_model_instance() for rendering.
+        """
+        return self.frontend_model(self)
+
     def __repr__(self):
         model_name = getattr(self.frontend_model, "__name__", str(self.frontend_model))
         return f"Field(name={self.name!r}, frontend_model={model_name})"
@@ -116,7 +138,12 @@ class SectionMeta(type):
                 value.name = key
                 fields[key] = value
 
+        # Each class gets its own _fields dict. Fields are fixed once the
+        # class is created, so the sorted view is computed here once too.
         namespace["_fields"] = fields
+        namespace["_sorted_fields"] = MappingProxyType(
+            dict(sorted(fields.items(), key=lambda x: (x[1].sort_order, x[0])))
+        )
         return super().__new__(mcs, name, bases, namespace)
 
 
@@ -134,21 +161,14 @@ class Section(metaclass=SectionMeta):
 
     label: str = ""
     sort_order: int = 0
-    _fields: dict[str, Field] = {}
-
-    def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
-        # Ensure each subclass has its own _fields dict
-        cls._fields = {}
-        for key, value in vars(cls).items():
-            if isinstance(value, Field):
-                value.name = key
-                cls._fields[key] = value
+    # Populated per class by SectionMeta
+    _fields: dict[str, Field]
+    _sorted_fields: Mapping[str, Field]
 
     @classmethod
-    def get_fields(cls) -> dict[str, Field]:
-        """Return all fields in this section, sorted by sort_order."""
-        return dict(sorted(cls._fields.items(), key=lambda x: (x[1].sort_order, x[0])))
+    def get_fields(cls) -> Mapping[str, Field]:
+        """Return all fields in this section (read-only), sorted by sort_order."""
+        return cls._sorted_fields
 
 
 class AppConfigDefinition:
@@ -163,64 +183,97 @@ class AppConfigDefinition:
         self.app_label = app_label
         self.config_class = config_class
         self.sections: dict[str, type[Section]] = {}
-
-        # Extract sections from the config class
-        for name in dir(config_class):
+        # Lowercase section keys by section name
+        self.section_keys: dict[str, str] = {}
+        # Fields by "section/field" path and by (section_key, field_name)
+        self._field_by_path: dict[str, Field] = {}
+        self._field_by_key: dict[tuple[str, str], Field] = {}
+        # Fields by HTML input name, for mapping form submissions back
+        self._field_by_input_name: dict[str, Field] = {}
+
+        # Extract sections from the config class. Read the class namespaces
+        # directly (bases first, so overrides win) instead of sorting dir()
+        # and resolving every attribute through getattr.
+        namespace: dict[str, Any] = {}
+        for klass in reversed(config_class.__mro__[:-1]):
+            namespace.update(klass.__dict__)
+        for name, attr in namespace.items():
             if name.startswith("_"):
                 continue
-            attr = getattr(config_class, name)
             if (
                 isinstance(attr, type)
                 and issubclass(attr, Section)
                 and attr is not Section
             ):
-                # Set path for each field in the section
-                section_name = name.lower()
+                # Set paths for each field in the section
+                section_key = sys.intern(name.lower())
                 for field_name, field in attr.get_fields().items():
-                    field.path = f"{section_name}/{field_name}"
+                    field.section_key = section_key
+                    field.path = f"{section_key}/{field_name}"
+                    field.db_path = sys.intern(f"{section_key}.{field_name}")
+                    field.input_name = sys.intern(f"config_{section_key}_{field_name}")
+                    field.input_id = sys.intern(f"id_{field.input_name}")
+                    self._field_by_path.setdefault(field.path, field)
+                    self._field_by_key.setdefault((section_key, field_name), field)
+                    self._field_by_input_name.setdefault(field.input_name, field)
                 self.sections[name] = attr
+                self.section_keys[name] = section_key
 
-    def get_sections(self) -> list[tuple[str, type[Section]]]:
-        """Return sections sorted by sort_order."""
-        return sorted(
+        # Sections and fields are fixed once registered, so precompute the
+        # sorted layout with section keys and DB paths for hot loops
+        self._sorted_sections = sorted(
             self.sections.items(),
             key=lambda x: (x[1].sort_order, x[0]),
         )
+        self.section_fields: list[
+            tuple[str, type[Section], list[tuple[str, Field, str]]]
+        ] = []
+        for name, section in self._sorted_sections:
+            fields = [
+                (field_name, field, field.db_path)
+                for field_name, field in section.get_fields().items()
+            ]
+            self.section_fields.append((self.section_keys[name], section, fields))
+
+    def get_sections(self) -> list[tuple[str, type[Section]]]:
+        """Return sections sorted by sort_order."""
+        return list(self._sorted_sections)
 
     def get_field(self, path: str) -> Field | None:
         """Get a field by its path (e.g., 'general/max_todos')."""
-        parts = path.split("/")
-        if len(parts) != 2:
-            return None
+        return self._field_by_path.get(path)
+
+    def get_section_field(self, section_key: str, field_name: str) -> Field | None:
+        """Get a field by section key and field name (e.g., 'general', 'max_todos')."""
+        return self._field_by_key.get((section_key, field_name))
 
-        section_name, field_name = parts
-        for name, section in self.sections.items():
-            if name.lower() == section_name:
-                return section.get_fields().get(field_name)
-        return None
+    def get_field_by_input_name(self, input_name: str) -> Field | None:
+        """Get a field by its HTML input name (e.g., 'config_general_max_todos')."""
+        return self._field_by_input_name.get(input_name)
 
 
 class ConfigRegistry:
     """
-    Singleton registry that holds all registered app configurations.
+    Registry that holds all registered app configurations.
 
     Configurations are registered via the @register_config decorator and
     are auto-discovered from sysconfig.py files in all installed apps.
+    Use the module-level config_registry instance rather than creating one.
     """
 
-    _instance = None
-    _configs: dict[str, AppConfigDefinition] = {}
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._configs = {}
-        return cls._instance
+    def __init__(self):
+        self._configs: dict[str, AppConfigDefinition] = {}
+        # Bumped whenever the set of configs changes, for derived caches
+        self.version = 0
+        # (app_label, config) pairs sorted by app label, built on demand
+        self._sorted_cache: tuple[tuple[str, AppConfigDefinition], ...] | None = None
 
     def register(self, app_label: str, config_class: type) -> None:
         """Register a configuration class for an app."""
         config_def = AppConfigDefinition(app_label, config_class)
         self._configs[app_label] = config_def
+        self.version += 1
+        self._sorted_cache = None
 
         # Create DB records for all fields with default values
         self._ensure_db_records(app_label, config_def)
@@ -237,23 +290,34 @@ class ConfigRegistry:
         try:
             from config.models import ConfigValue
 
-            for section_name, section in config_def.get_sections():
-                section_key = section_name.lower()
-                for field_name, field in section.get_fields().items():
-                    db_path = f"{section_key}.{field_name}"
+            existing = set(
+                ConfigValue.objects.filter(app_label=app_label).values_list(
+                    "path", flat=True
+                )
+            )
+
+            new_records = []
+            for _, _, fields in config_def.section_fields:
+                for _, field, db_path in fields:
+                    # Don't overwrite existing values
+                    if db_path in existing:
+                        continue
 
                     # Serialize the default value
                     default_value = None
                     if field.default is not None:
-                        frontend_model = field.get_frontend_model_instance()
+                        frontend_model = field.shared_frontend_model
                         default_value = frontend_model.serialize_value(field.default)
 
-                    # Create only if doesn't exist (don't overwrite existing values)
-                    ConfigValue.objects.get_or_create(
-                        app_label=app_label,
-                        path=db_path,
-                        defaults={"value": default_value},
+                    new_records.append(
+                        ConfigValue(
+                            app_label=app_label, path=db_path, value=default_value
+                        )
                     )
+
+            # ignore_conflicts covers rows created concurrently by another process
+            if new_records:
+                ConfigValue.objects.bulk_create(new_records, ignore_conflicts=True)
         except (
             django.db.utils.OperationalError,
             django.db.utils.ProgrammingError,
@@ -270,6 +334,12 @@ class ConfigRegistry:
         """Get all registered configurations."""
         return self._configs.copy()
 
+    def get_all_configs_sorted(self) -> tuple[tuple[str, AppConfigDefinition], ...]:
+        """Get all registered configurations as (app_label, config) pairs, sorted."""
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(self._configs.items()))
+        return self._sorted_cache
+
     def get_registered_apps(self) -> list[str]:
         """Get list of all apps with registered configurations."""
         return list(self._configs.keys())
@@ -277,6 +347,8 @@ class ConfigRegistry:
     def clear(self) -> None:
         """Clear all registered configurations (useful for testing)."""
         self._configs.clear()
+        self.version += 1
+        self._sorted_cache = None
 
 
 # Global registry instance
@@ -5,11 +5,89 @@ Validators are used to ensure configuration values meet specific requirements
 before being saved to the database.
 """
 
+import ipaddress
+import json
+import os
 import re
-from abc import ABC, abstractmethod
+import string
+import threading
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
+
+class _Re2Pattern:
+    """
+    re2 pattern that falls back to re for strings re2 can't encode.
+
+    re2 works on UTF-8 and raises UnicodeEncodeError for strings with lone
+    surrogates; those are matched with the equivalent re pattern instead.
+    Other attributes are delegated to the re2 pattern.
+    """
+
+    def __init__(self, pattern: str, flags: int):
+        self._re2 = re2.compile(("(?i)" if flags else "") + pattern)
+        self._pattern = pattern
+        self._flags = flags
+        self._re = None
+
+    def _fallback(self):
+        if self._re is None:
+            self._re = re.compile(self._pattern, self._flags)
+        return self._re
+
+    def fullmatch(self, string: str):
+        try:
+            return self._re2.fullmatch(string)
+        except UnicodeEncodeError:
+            return self._fallback().fullmatch(string)
+
+    def match(self, string: str):
+        try:
+            return self._re2.match(string)
+        except UnicodeEncodeError:
+            return self._fallback().match(string)
+
+    def search(self, string: str):
+        try:
+            return self._re2.search(string)
+        except UnicodeEncodeError:
+            return self._fallback().search(string)
+
+    def __getattr__(self, name: str):
+        return getattr(self._re2, name)
+
+
+def _compile_pattern(pattern: str, flags: int = 0):
+    """
+    Compile a fixed validator pattern, using re2 when it is installed.
+
+    re2 matches in linear time, so crafted input can't trigger catastrophic
+    backtracking. Only re.IGNORECASE is translated; patterns re2 can't
+    compile fall back to re. Callers use fullmatch(), which behaves the same
+    on both engines.
+    """
+    if re2 is not None and not flags & ~re.IGNORECASE:
+        try:
+            return _Re2Pattern(pattern, flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 
 class ValidationError(Exception):
     """Raised when a configuration value fails validation."""
@@ -25,8 +103,8 @@ class ValidationError(Exception):
         return self.message
 
 
-class BaseValidator(ABC):
-    """Abstract base class for all validators."""
+class BaseValidator:
+    """Base class for all validators."""
 
     # Error message template - subclasses should override
     message: str = "Invalid value."
@@ -41,7 +119,6 @@ class BaseValidator(ABC):
         if message is not None:
             self.message = message
 
-    @abstractmethod
     def __call__(self, value: Any) -> None:
         """
         Validate the value.
@@ -52,7 +129,7 @@ class BaseValidator(ABC):
         Raises:
             ValidationError: If validation fails
         """
-        pass
+        raise NotImplementedError
 
     def _fail(self, message: str | None = None):
         """Raise a ValidationError with the given or default message."""
@@ -72,9 +149,11 @@ class NotEmptyValidator(BaseValidator):
     def __call__(self, value: Any) -> None:
         if value is None:
             self._fail()
-        if isinstance(value, str) and value.strip() == "":
-            self._fail()
-        if isinstance(value, list | dict) and len(value) == 0:
+        if isinstance(value, str):
+            # Blank check without building a stripped copy
+            if not value or value.isspace():
+                self._fail()
+        elif not value and isinstance(value, list | dict):
             self._fail()
 
 
@@ -126,12 +205,21 @@ class MaxLengthValidator(BaseValidator):
 class RegexValidator(BaseValidator):
     """Validates that a string matches a regular expression pattern."""
 
+    # re flags that map onto hyperscan compile flags; any other flag
+    # keeps the validator on the re engine.
+    _HYPERSCAN_FLAGS = {
+        re.IGNORECASE: "HS_FLAG_CASELESS",
+        re.MULTILINE: "HS_FLAG_MULTILINE",
+        re.DOTALL: "HS_FLAG_DOTALL",
+    }
+
     def __init__(
         self,
         pattern: str,
         message: str | None = None,
         flags: int = 0,
         inverse: bool = False,
+        engine: str = "re",
     ):
         """
         Args:
@@ -139,18 +227,85 @@ class RegexValidator(BaseValidator):
             message: Custom error message
             flags: Regex flags (e.g., re.IGNORECASE)
             inverse: If True, validation fails when pattern matches
+            engine: "re" (default) or "hyperscan". The hyperscan engine is
+                used only when the package is installed and the pattern
+                compiles there; otherwise the validator falls back to re.
         """
         self.pattern = re.compile(pattern, flags)
         self.inverse = inverse
+        self._hs_db = None
+        self._hs_local = None
+        if engine == "hyperscan":
+            self._hs_db = self._compile_hyperscan(pattern, flags)
+        # Only hyperscan needs per-thread scratch space; re validators stay
+        # plain objects that can be copied and pickled
+        if self._hs_db is not None:
+            self._hs_local = threading.local()
         super().__init__(message or "Value does not match the required pattern.")
 
+    @classmethod
+    def _compile_hyperscan(cls, pattern: str, flags: int):
+        """Compile pattern into a hyperscan database, or None if unsupported."""
+        if hyperscan is None:
+            return None
+
+        hs_flags = (
+            hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        flags &= ~re.UNICODE
+        for re_flag, hs_flag in cls._HYPERSCAN_FLAGS.items():
+            if flags & re_flag:
+                hs_flags |= getattr(hyperscan, hs_flag)
+                flags &= ~re_flag
+        if flags:
+            return None
+
+        db = hyperscan.Database()
+        try:
+            db.compile(
+                expressions=[pattern.encode()],
+                ids=[0],
+                elements=1,
+                flags=[hs_flags],
+            )
+        except hyperscan.error:
+            # Back-references, lookarounds etc. are not supported.
+            return None
+        return db
+
+    def _search(self, value: str) -> bool:
+        db = self._hs_db
+        if db is None:
+            return self.pattern.search(value) is not None
+
+        try:
+            data = value.encode()
+        except UnicodeEncodeError:
+            return self.pattern.search(value) is not None
+
+        # Scratch space is not thread-safe, so keep one per thread.
+        scratch = getattr(self._hs_local, "scratch", None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = hyperscan.Scratch(db)
+
+        hits = []
+        db.scan(data, match_event_handler=self._on_match, context=hits, scratch=scratch)
+        return bool(hits)
+
+    @staticmethod
+    def _on_match(id, start, end, flags, context):
+        context.append(id)
+
     def __call__(self, value: Any) -> None:
         if value is None:
             return
         if not isinstance(value, str):
             return
 
-        matches = self.pattern.search(value) is not None
+        matches = self._search(value)
         if self.inverse and matches:
             self._fail()
         elif not self.inverse and not matches:
@@ -162,6 +317,21 @@ class RegexValidator(BaseValidator):
 # ============================================================================
 
 
+def _to_number(value: Any) -> int | Decimal:
+    """
+    Convert a value to a number for exact comparison.
+
+    ints and Decimals compare exactly against Decimal bounds, so they are
+    returned as-is; anything else goes through Decimal(str(value)).
+
+    Raises:
+        ValueError, TypeError, InvalidOperation: If value is not numeric
+    """
+    if value.__class__ is int or value.__class__ is Decimal:
+        return value
+    return Decimal(str(value))
+
+
 class RangeValidator(BaseValidator):
     """Validates that a numeric value is within a specified range."""
 
@@ -179,6 +349,9 @@ class RangeValidator(BaseValidator):
         """
         self.min_value = min_value
         self.max_value = max_value
+        # Bounds are fixed, so convert them once rather than on every call
+        self._min_dec = None if min_value is None else Decimal(str(min_value))
+        self._max_dec = None if max_value is None else Decimal(str(max_value))
 
         if message is None:
             if min_value is not None and max_value is not None:
@@ -197,14 +370,14 @@ class RangeValidator(BaseValidator):
             return
 
         try:
-            num_value = Decimal(str(value))
+            num_value = _to_number(value)
         except (ValueError, TypeError, InvalidOperation):
             self._fail("Must be a valid number.")
             return
 
-        if self.min_value is not None and num_value < Decimal(str(self.min_value)):
+        if self._min_dec is not None and num_value < self._min_dec:
             self._fail()
-        if self.max_value is not None and num_value > Decimal(str(self.max_value)):
+        if self._max_dec is not None and num_value > self._max_dec:
             self._fail()
 
 
@@ -217,7 +390,7 @@ class PositiveValidator(BaseValidator):
         if value is None:
             return
         try:
-            if Decimal(str(value)) <= 0:
+            if _to_number(value) <= 0:
                 self._fail()
         except (ValueError, TypeError, InvalidOperation):
             self._fail("Must be a valid number.")
@@ -232,7 +405,7 @@ class NonNegativeValidator(BaseValidator):
         if value is None:
             return
         try:
-            if Decimal(str(value)) < 0:
+            if _to_number(value) < 0:
                 self._fail()
         except (ValueError, TypeError, InvalidOperation):
             self._fail("Must be a valid number.")
@@ -249,7 +422,7 @@ class EmailValidator(BaseValidator):
     message = "Enter a valid email address."
 
     # Basic email pattern - covers most cases
-    EMAIL_PATTERN = re.compile(
+    EMAIL_PATTERN = _compile_pattern(
         r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
         re.IGNORECASE,
     )
@@ -260,7 +433,7 @@ class EmailValidator(BaseValidator):
         if not isinstance(value, str):
             self._fail()
             return
-        if not self.EMAIL_PATTERN.match(value):
+        if not self.EMAIL_PATTERN.fullmatch(value):
             self._fail()
 
 
@@ -270,15 +443,16 @@ class UrlValidator(BaseValidator):
     message = "Enter a valid URL."
 
     # URL pattern supporting http, https, ftp
-    URL_PATTERN = re.compile(
+    URL_PATTERN = _compile_pattern(
         r"^(https?|ftp)://"  # Scheme
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,63}\.?|"  # Domain
         r"localhost|"  # localhost
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # or IPv4
-        r"(?::\d+)?"  # Optional port
+        r"[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3})"  # or IPv4
+        r"(?::[0-9]+)?"  # Optional port
         r"(?:/?|[/?]\S+)$",  # Path
         re.IGNORECASE,
     )
+    PATTERN_SCHEMES = frozenset({"http", "https", "ftp"})
 
     def __init__(self, schemes: list[str] | None = None, message: str | None = None):
         """
@@ -295,12 +469,19 @@ class UrlValidator(BaseValidator):
         if not isinstance(value, str):
             self._fail()
             return
-        if not self.URL_PATTERN.match(value):
+
+        scheme = value.partition("://")[0]
+        # URL_PATTERN only accepts these schemes, so skip the regex for
+        # anything else (casefold mirrors the pattern's IGNORECASE)
+        if scheme.casefold() not in self.PATTERN_SCHEMES:
             self._fail()
+            return
+        if not self.URL_PATTERN.fullmatch(value):
+            self._fail()
+            return
 
         # Check scheme
-        scheme = value.split("://")[0].lower()
-        if scheme not in self.schemes:
+        if scheme.lower() not in self.schemes:
             self._fail(f"URL scheme must be one of: {', '.join(self.schemes)}")
 
 
@@ -309,19 +490,26 @@ class IPv4Validator(BaseValidator):
 
     message = "Enter a valid IPv4 address."
 
-    IPV4_PATTERN = re.compile(
-        r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
-        r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-    )
-
     def __call__(self, value: Any) -> None:
         if value is None or value == "":
             return
         if not isinstance(value, str):
             self._fail()
             return
-        if not self.IPV4_PATTERN.match(value):
+
+        # Four dot-separated octets of 1-3 ASCII digits, each at most 255
+        # (leading zeros allowed)
+        parts = value.split(".")
+        if len(parts) != 4:
             self._fail()
+        for part in parts:
+            if not (
+                0 < len(part) <= 3
+                and part.isascii()
+                and part.isdigit()
+                and int(part) <= 255
+            ):
+                self._fail()
 
 
 class IPv6Validator(BaseValidator):
@@ -336,9 +524,11 @@ class IPv6Validator(BaseValidator):
             self._fail()
             return
 
-        # Use Python's ipaddress module for proper IPv6 validation
-        import ipaddress
+        # Every IPv6 address contains a colon; skip the full parse otherwise
+        if ":" not in value:
+            self._fail()
 
+        # Use Python's ipaddress module for proper IPv6 validation
         try:
             ipaddress.IPv6Address(value)
         except ipaddress.AddressValueError:
@@ -366,10 +556,13 @@ class IPAddressValidator(BaseValidator):
             self._fail()
             return
 
-        import ipaddress
-
+        # Parse as the only family the value can belong to, rather than
+        # letting ip_address() try IPv4 first and then IPv6
         try:
-            ip = ipaddress.ip_address(value)
+            if ":" in value:
+                ip = ipaddress.IPv6Address(value)
+            else:
+                ip = ipaddress.IPv4Address(value)
             if self.version == 4 and ip.version != 4:
                 self._fail("Enter a valid IPv4 address.")
             elif self.version == 6 and ip.version != 6:
@@ -383,15 +576,7 @@ class HostnameValidator(BaseValidator):
 
     message = "Enter a valid hostname."
 
-    # RFC 1123 compliant hostname pattern
-    HOSTNAME_PATTERN = re.compile(
-        r"^(?=.{1,253}$)"  # Max total length
-        r"(?!-)"  # Cannot start with hyphen
-        r"[a-zA-Z0-9-]{1,63}"  # First label
-        r"(?:\.[a-zA-Z0-9-]{1,63})*"  # Additional labels
-        r"(?<!-)$",  # Cannot end with hyphen
-        re.IGNORECASE,
-    )
+    HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + "-.")
 
     def __call__(self, value: Any) -> None:
         if value is None or value == "":
@@ -399,8 +584,19 @@ class HostnameValidator(BaseValidator):
         if not isinstance(value, str):
             self._fail()
             return
-        if not self.HOSTNAME_PATTERN.match(value):
+
+        # RFC 1123: at most 253 characters of letters, digits, hyphens and
+        # dots, not starting or ending with a hyphen, labels of 1-63 characters
+        if (
+            len(value) > 253
+            or value[0] == "-"
+            or value[-1] == "-"
+            or not self.HOSTNAME_CHARS.issuperset(value)
+        ):
             self._fail()
+        for label in value.split("."):
+            if not 0 < len(label) <= 63:
+                self._fail()
 
 
 # ============================================================================
@@ -418,6 +614,11 @@ class ChoiceValidator(BaseValidator):
             message: Custom error message
         """
         self.choices = choices
+        # Set for O(1) membership; None if any choice is unhashable
+        try:
+            self._choice_set = frozenset(choices)
+        except TypeError:
+            self._choice_set = None
         super().__init__(
             message or f"Must be one of: {', '.join(str(c) for c in choices)}"
         )
@@ -425,6 +626,14 @@ class ChoiceValidator(BaseValidator):
     def __call__(self, value: Any) -> None:
         if value is None:
             return
+        choices = self._choice_set
+        if choices is not None:
+            try:
+                if value not in choices:
+                    self._fail()
+                return
+            except TypeError:
+                pass  # Unhashable value - fall back to a list scan
         if value not in self.choices:
             self._fail()
 
@@ -439,7 +648,7 @@ class SlugValidator(BaseValidator):
 
     message = "Enter a valid slug (letters, numbers, hyphens, underscores only)."
 
-    SLUG_PATTERN = re.compile(r"^[-a-zA-Z0-9_]+$")
+    SLUG_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
 
     def __call__(self, value: Any) -> None:
         if value is None or value == "":
@@ -447,7 +656,7 @@ class SlugValidator(BaseValidator):
         if not isinstance(value, str):
             self._fail()
             return
-        if not self.SLUG_PATTERN.match(value):
+        if not self.SLUG_CHARS.issuperset(value):
             self._fail()
 
 
@@ -462,7 +671,14 @@ class JsonValidator(BaseValidator):
         if not isinstance(value, str):
             return  # Already parsed
 
-        import json
+        if orjson is not None:
+            try:
+                orjson.loads(value)
+                return
+            except orjson.JSONDecodeError:
+                # orjson is stricter (no NaN/Infinity, 64-bit integers, valid
+                # UTF-8 only), so let json decide before failing
+                pass
 
         try:
             json.loads(value)
@@ -491,16 +707,12 @@ class PathValidator(BaseValidator):
             self._fail()
             return
 
-        import os
-
         if self.must_be_absolute and not os.path.isabs(value):
             self._fail("Path must be absolute.")
 
-        # Check for invalid characters (basic check)
-        invalid_chars = ["\x00"]  # Null byte
-        for char in invalid_chars:
-            if char in value:
-                self._fail()
+        # Check for invalid characters (basic check): null byte
+        if "\x00" in value:
+            self._fail()
 
 
 class PortValidator(BaseValidator):
@@ -512,11 +724,14 @@ class PortValidator(BaseValidator):
         if value is None or value == "":
             return
 
-        try:
-            port = int(value)
-            if port < 1 or port > 65535:
+        if value.__class__ is int:
+            port = value
+        else:
+            try:
+                port = int(value)
+            except (ValueError, TypeError):
                 self._fail()
-        except (ValueError, TypeError):
+        if not 1 <= port <= 65535:
             self._fail()
 
 
@@ -525,10 +740,7 @@ class DomainValidator(BaseValidator):
 
     message = "Enter a valid domain name."
 
-    DOMAIN_PATTERN = re.compile(
-        r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*"
-        r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$"
-    )
+    DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + "-.")
 
     def __call__(self, value: Any) -> None:
         if value is None or value == "":
@@ -538,8 +750,14 @@ class DomainValidator(BaseValidator):
             return
         if len(value) > 253:
             self._fail()
-        if not self.DOMAIN_PATTERN.match(value):
+
+        # Dot-separated labels of 1-63
+        # letters, digits and hyphens, not starting or ending with a hyphen
+        if not self.DOMAIN_CHARS.issuperset(value):
             self._fail()
+        for label in value.split("."):
+            if not 0 < len(label) <= 63 or label[0] == "-" or label[-1] == "-":
+                self._fail()
 
 
 # ============================================================================
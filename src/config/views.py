@@ -5,16 +5,43 @@ These views provide the admin interface for managing app configurations.
 They are integrated into Django's admin site and require admin permissions.
 """
 
+from functools import lru_cache
+
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import redirect, render
+from django.template import Context
 from django.utils.decorators import method_decorator
 from django.views import View
 
 from .accessor import config
 from .models import ConfigValue
 from .registry import config_registry
-from .validators import validate_value
+from .validators import ValidationError, validate_value
+
+
+@lru_cache(maxsize=1)
+def _registry_summary(registry_version: int) -> tuple[dict, ...]:
+    """
+    Build the app list shown by ConfigAppListView.
+
+    Keyed on the registry version, so registering a config rebuilds it.
+    """
+    # Build list of apps with their metadata
+    apps = []
+    for app_label, config_def in config_registry.get_all_configs_sorted():
+        section_count = len(config_def.sections)
+        field_count = sum(
+            len(section.get_fields()) for section in config_def.sections.values()
+        )
+        apps.append(
+            {
+                "app_label": app_label,
+                "section_count": section_count,
+                "field_count": field_count,
+            }
+        )
+    return tuple(apps)
 
 
 @method_decorator(staff_member_required, name="dispatch")
@@ -26,26 +53,9 @@ class ConfigAppListView(View):
     template_name = "config/app_list.html"
 
     def get(self, request):
-        configs = config_registry.get_all_configs()
-
-        # Build list of apps with their metadata
-        apps = []
-        for app_label, config_def in sorted(configs.items()):
-            section_count = len(config_def.sections)
-            field_count = sum(
-                len(section.get_fields()) for section in config_def.sections.values()
-            )
-            apps.append(
-                {
-                    "app_label": app_label,
-                    "section_count": section_count,
-                    "field_count": field_count,
-                }
-            )
-
         context = {
             "title": "System Configuration",
-            "apps": apps,
+            "apps": _registry_summary(config_registry.version),
             "has_permission": True,
             "site_header": "Django administration",
             "site_title": "Django site admin",
@@ -106,12 +116,13 @@ class ConfigAppDetailView(View):
         if not config_def:
             return redirect("config:app_list")
 
-        # Get the list of changed fields (optimization)
+        # Get the list of changed fields (optimization), keeping the
+        # submitted order and dropping duplicates
         changed_fields_str = request.POST.get("changed_fields", "").strip()
         changed_fields = (
-            {f for f in changed_fields_str.split(",") if f}
+            list(dict.fromkeys(filter(None, changed_fields_str.split(","))))
             if changed_fields_str
-            else set()
+            else []
         )
 
         # If no fields were changed, skip saving entirely
@@ -119,28 +130,32 @@ class ConfigAppDetailView(View):
             messages.info(request, "No changes to save.")
             return redirect("config:app_detail", app_label=app_label)
 
-        # First pass: validate all changed fields using their validators
+        # Single pass over the changed fields only: process and validate each
+        # one, collecting values so they can all be saved together
         validation_errors = []
-        for section_name, section in config_def.get_sections():
-            section_key = section_name.lower()
-            for field_name, field in section.get_fields().items():
-                input_name = f"config_{section_key}_{field_name}"
-
-                # Only validate changed fields
-                if input_name not in changed_fields:
-                    continue
-
-                # Skip if field has no validators
-                if not field.validators:
-                    continue
-
-                # Get and process value
-                processed_value = self._get_processed_value(request, field, input_name)
+        values = {}
+        validation_cache = {}
+        for input_name in changed_fields:
+            field = config_def.get_field_by_input_name(input_name)
+            if field is None:
+                continue
+
+            # Get and process value
+            processed_value = self._get_processed_value(request, field, input_name)
+
+            # Run all validators for this field
+            if field.validators:
+                field_label = field.label or field.name
+                validation_errors.extend(
+                    self._validate(
+                        processed_value, field.validators, field_label, validation_cache
+                    )
+                )
 
-                # Run all validators for this field
-                field_label = field.label or field_name
-                errors = validate_value(processed_value, field.validators, field_label)
-                validation_errors.extend(errors)
+            # Use the accessor path (dot notation). Fields can be shared by
+            # configs inheriting the same sections, so the app label comes
+            # from the request rather than the field
+            values[f"{app_label}.{field.db_path}"] = processed_value
 
         # If validation errors, show them and redirect back
         if validation_errors:
@@ -148,24 +163,8 @@ class ConfigAppDetailView(View):
                 messages.error(request, error)
             return redirect("config:app_detail", app_label=app_label)
 
-        # Process only changed fields
-        saved_count = 0
-        for section_name, section in config_def.get_sections():
-            section_key = section_name.lower()
-            for field_name, field in section.get_fields().items():
-                input_name = f"config_{section_key}_{field_name}"
-
-                # Skip if field wasn't changed
-                if input_name not in changed_fields:
-                    continue
-
-                # Get and process value
-                processed_value = self._get_processed_value(request, field, input_name)
-
-                # Use the accessor to set the value (dot notation)
-                full_path = f"{app_label}.{section_key}.{field_name}"
-                config.set(full_path, processed_value)
-                saved_count += 1
+        # Save all changed fields in one batch
+        saved_count = config.set_many(values)
 
         if saved_count > 0:
             messages.success(
@@ -177,6 +176,28 @@ class ConfigAppDetailView(View):
 
         return redirect("config:app_detail", app_label=app_label)
 
+    def _validate(
+        self, value, validators: list, field_label: str, cache: dict
+    ) -> list[str]:
+        """
+        Run validators against a value, reusing results within a request.
+
+        Fields often share validator instances and submit the same values,
+        so results are cached by (validator ids, value type, value). Only
+        the bare messages are cached; the field label is applied per field.
+        """
+        try:
+            key = (tuple(map(id, validators)), value.__class__, value)
+            hash(key)
+        except TypeError:
+            # Unhashable value - validate without caching
+            return validate_value(value, validators, field_label)
+
+        errors = cache.get(key)
+        if errors is None:
+            errors = cache[key] = validate_value(value, validators)
+        return [str(ValidationError(message, field_label)) for message in errors]
+
     def _get_processed_value(self, request, field, input_name: str):
         """
         Get and process a value from POST data.
@@ -190,27 +211,24 @@ class ConfigAppDetailView(View):
             The processed value in its appropriate Python type
         """
         raw_value = request.POST.get(input_name)
-        frontend_model = field.get_frontend_model_instance()
-        return frontend_model.get_value(raw_value)
+        return field.shared_frontend_model.get_value(raw_value)
 
     def _build_sections_data(self, app_label: str, config_def) -> list[dict]:
         """Build the sections data structure for the template."""
         # Fetch all stored values for this app
-        stored_values = {
-            cv.path: cv.value for cv in ConfigValue.objects.filter(app_label=app_label)
-        }
+        stored_values = dict(
+            ConfigValue.objects.filter(app_label=app_label).values_list("path", "value")
+        )
 
+        # One Context shared by all field renders on the page
+        render_context = Context()
         sections_data = []
         for section_name, section in config_def.get_sections():
-            section_key = section_name.lower()
             fields_data = []
 
             for field_name, field in section.get_fields().items():
-                # DB path uses dot notation
-                db_path = f"{section_key}.{field_name}"
-
-                # Get stored value or use default
-                stored_value = stored_values.get(db_path)
+                # Get stored value or use default (DB path uses dot notation)
+                stored_value = stored_values.get(field.db_path)
                 if stored_value is None:
                     current_value = field.default
                 else:
@@ -223,7 +241,7 @@ class ConfigAppDetailView(View):
                     {
                         "name": field_name,
                         "field": field,
-                        "rendered_input": frontend_model.render(),
+                        "rendered_input": frontend_model.render(render_context),
                         "has_stored_value": stored_value is not None,
                     }
                 )
@@ -1,6 +1,29 @@
+from django.contrib.auth.models import Group
+from django.core.cache import cache
 from rest_framework.permissions import BasePermission
 from todoapp.settings import APP_CONFIG
 
+APP_USERS_GROUP_NAME = APP_CONFIG["APP_USERS_GROUP_NAME"]
+APP_USERS_GROUP_ID_CACHE_KEY = "core:app_users_group_id"
+
+
+def get_app_users_group_id() -> int | None:
+    """
+    Get the id of the App Users group, or None if it doesn't exist yet.
+
+    The id is cached for an hour; a missing group is looked up again each time.
+    """
+    group_id = cache.get(APP_USERS_GROUP_ID_CACHE_KEY)
+    if group_id is None:
+        group_id = (
+            Group.objects.filter(name=APP_USERS_GROUP_NAME)
+            .values_list("id", flat=True)
+            .first()
+        )
+        if group_id is not None:
+            cache.set(APP_USERS_GROUP_ID_CACHE_KEY, group_id, 3600)
+    return group_id
+
 
 class IsAppUserGroupMember(BasePermission):
     """
@@ -9,5 +32,20 @@ class IsAppUserGroupMember(BasePermission):
     """
 
     def has_permission(self, request, view):
-        app_user_group_name = APP_CONFIG["APP_USERS_GROUP_NAME"]
-        return request.user.groups.filter(name=app_user_group_name).exists()
+        # Checked once per request, however many times permissions run
+        is_app_user = getattr(request, "_is_app_user", None)
+        if is_app_user is None:
+            is_app_user = request._is_app_user = self._is_member(request.user)
+        return is_app_user
+
+    def _is_member(self, user) -> bool:
+        if not user.is_authenticated:
+            return False
+        group_id = get_app_users_group_id()
+        if group_id is None:
+            return False
+        # Look up the membership row by (user_id, group_id) on the M2M
+        # table's unique index, without joining auth_group to match the name
+        return user.groups.through.objects.filter(
+            user_id=user.id, group_id=group_id
+        ).exists()
@@ -0,0 +1,18 @@
+from functools import partial
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .permissions import APP_USERS_GROUP_ID_CACHE_KEY
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def invalidate_app_users_group_id(sender, instance, **kwargs):
+    # Any group change may be the App Users group being renamed, deleted or
+    # recreated; groups change rarely, so just drop the cached id. Wait for
+    # the commit, or a concurrent lookup could re-cache the old id.
+    transaction.on_commit(partial(cache.delete, APP_USERS_GROUP_ID_CACHE_KEY))
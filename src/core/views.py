@@ -1,12 +1,10 @@
-from django.contrib.auth.models import Group
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from todo.views import TodoGroupViewSet, TodoViewSet
-from todoapp.settings import APP_CONFIG
 
-from .permissions import IsAppUserGroupMember
+from .permissions import IsAppUserGroupMember, get_app_users_group_id
 from .serializers import UserRegistrationSerializer
 
 
@@ -29,12 +27,10 @@ class RegisterView(APIView):
             user = serializer.save()
 
             # Assign user to App Users group
-            group_name = APP_CONFIG["APP_USERS_GROUP_NAME"]
-            try:
-                group = Group.objects.get(name=group_name)
-                user.groups.add(group)
-            except Group.DoesNotExist:
-                pass  # Group doesn't exist yet, skip assignment
+            group_id = get_app_users_group_id()
+            # Skip assignment if the group doesn't exist yet
+            if group_id is not None:
+                user.groups.add(group_id)
 
             return Response(
                 {"message": "User registered successfully.", "username": user.username},
@@ -1,8 +1,15 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from .models import EmailTemplate
 
 
+class EmailTemplateChangeList(ChangeList):
+    def get_queryset(self, request):
+        # The changelist never shows the body, which can be large
+        return super().get_queryset(request).defer("body")
+
+
 @admin.register(EmailTemplate)
 class EmailTemplateAdmin(admin.ModelAdmin):
     list_display = ["identifier", "subject", "created_at", "updated_at"]
@@ -10,3 +17,6 @@ class EmailTemplateAdmin(admin.ModelAdmin):
     search_fields = ["identifier", "subject"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
+
+    def get_changelist(self, request, **kwargs):
+        return EmailTemplateChangeList
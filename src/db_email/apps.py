@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class DbEmailConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "db_email"
+
+    def ready(self):
+        # Register cache invalidation for edited templates
+        from . import signals  # noqa: F401
@@ -0,0 +1,33 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import EmailTemplate
+from .template_backend import invalidate_template_cache
+
+
+# Cache entries are dropped only once the change is committed: dropping them
+# inside the transaction lets a concurrent lookup re-cache the old body (or
+# the miss marker), and cached bodies never expire.
+
+
+@receiver(pre_save, sender=EmailTemplate)
+def invalidate_renamed_template(sender, instance, **kwargs):
+    # A changed identifier leaves the body cached under the old name
+    if instance.pk is None:
+        return
+    old_identifier = (
+        EmailTemplate.objects.filter(pk=instance.pk)
+        .values_list("identifier", flat=True)
+        .first()
+    )
+    if old_identifier is not None and old_identifier != instance.identifier:
+        transaction.on_commit(partial(invalidate_template_cache, old_identifier))
+
+
+@receiver(post_save, sender=EmailTemplate)
+@receiver(post_delete, sender=EmailTemplate)
+def invalidate_template(sender, instance, **kwargs):
+    transaction.on_commit(partial(invalidate_template_cache, instance.identifier))
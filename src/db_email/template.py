@@ -1,5 +1,14 @@
+from functools import lru_cache
+
 from django.template import Context
 from django.template import Template as DjangoTemplate
+from django.utils.safestring import mark_safe
+
+
+@lru_cache(maxsize=512)
+def _compile(source: str) -> DjangoTemplate:
+    """Compile template source, reusing the result for identical sources."""
+    return DjangoTemplate(source)
 
 
 class DBEmailTemplate:
@@ -8,10 +17,20 @@ class DBEmailTemplate:
         self.engine = engine
         self.metadata = metadata or {}
 
-        # Use Django's built-in template engine to render
-        self._template = DjangoTemplate(source)
+        # Sources without tags, variables or comments render to themselves,
+        # so they skip the template engine entirely
+        self._static = not ("{{" in source or "{%" in source or "{#" in source)
+        if self._static:
+            self._template = None
+            self._rendered = mark_safe(source)
+        else:
+            # Use Django's built-in template engine to render
+            self._template = _compile(source)
 
     def render(self, context=None, request=None):
+        if self._static:
+            return self._rendered
+
         context = context or {}
 
         if not isinstance(context, Context):
@@ -1,9 +1,26 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
 from django.template.backends.base import BaseEngine
 from django.template.exceptions import TemplateDoesNotExist
 
 from .models import EmailTemplate
 from .template import DBEmailTemplate
 
+CACHE_KEY_PREFIX = "dbemail:"
+# Cached for identifiers with no stored template. This engine is tried first
+# for every template lookup, so misses are cached as well as bodies.
+# Bodies are strings, so False can't collide with one.
+MISSING = False
+# Default number of identifiers per query in get_templates(), overridable
+# with the DB_EMAIL_BATCH_FETCH_SIZE setting
+BATCH_FETCH_SIZE = 250
+
+
+def invalidate_template_cache(identifier: str) -> None:
+    """Drop the cached body of a template so the next lookup reads the DB."""
+    cache.delete(f"{CACHE_KEY_PREFIX}{identifier}")
+
 
 class DBEmailTemplateEngine(BaseEngine):
     def __init__(self, params):
@@ -14,6 +31,18 @@ class DBEmailTemplateEngine(BaseEngine):
                 "APP_DIRS": params.get("APP_DIRS"),
             }
         )
+        self.batch_fetch_size = getattr(
+            settings, "DB_EMAIL_BATCH_FETCH_SIZE", BATCH_FETCH_SIZE
+        )
+        if (
+            isinstance(self.batch_fetch_size, bool)
+            or not isinstance(self.batch_fetch_size, int)
+            or self.batch_fetch_size < 1
+        ):
+            raise ImproperlyConfigured(
+                "DB_EMAIL_BATCH_FETCH_SIZE must be a positive integer, "
+                f"got {self.batch_fetch_size!r}."
+            )
 
     def from_string(self, template_code):
         return DBEmailTemplate(
@@ -22,13 +51,66 @@ class DBEmailTemplateEngine(BaseEngine):
         )
 
     def get_template(self, template_name):
-        try:
-            record = EmailTemplate.objects.get(identifier=template_name)
-        except EmailTemplate.DoesNotExist:
-            raise TemplateDoesNotExist(template_name) from None
+        # Bodies (and misses) are cached until the template is saved or deleted
+        cache_key = f"{CACHE_KEY_PREFIX}{template_name}"
+        body = cache.get(cache_key)
+        if body is None:
+            body = (
+                EmailTemplate.objects.filter(identifier=template_name)
+                .values_list("body", flat=True)
+                .first()
+            )
+            if body is None:
+                body = MISSING
+            cache.set(cache_key, body, timeout=None)
+        if body is MISSING:
+            raise TemplateDoesNotExist(template_name)
 
         return DBEmailTemplate(
-            source=record.body,
+            source=body,
             engine=self,
-            metadata={"identifier": record.identifier},
+            metadata={"identifier": template_name},
         )
+
+    def get_templates(self, template_names):
+        """
+        Get several templates at once, e.g. for bulk sends.
+
+        Cached bodies are read in one cache round-trip and the rest are
+        fetched with one query per DB_EMAIL_BATCH_FETCH_SIZE names.
+
+        Returns:
+            Dict mapping template names to templates; names with no stored
+            template are left out
+        """
+        cache_keys = {f"{CACHE_KEY_PREFIX}{name}": name for name in template_names}
+        bodies = {
+            cache_keys[cache_key]: body
+            for cache_key, body in cache.get_many(cache_keys).items()
+        }
+
+        missing = [name for name in cache_keys.values() if name not in bodies]
+        batch_size = self.batch_fetch_size
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            rows = dict(
+                EmailTemplate.objects.filter(identifier__in=batch).values_list(
+                    "identifier", "body"
+                )
+            )
+            loaded = {name: rows.get(name, MISSING) for name in batch}
+            cache.set_many(
+                {f"{CACHE_KEY_PREFIX}{name}": body for name, body in loaded.items()},
+                timeout=None,
+            )
+            bodies.update(loaded)
+
+        return {
+            name: DBEmailTemplate(
+                source=body,
+                engine=self,
+                metadata={"identifier": name},
+            )
+            for name, body in bodies.items()
+            if body is not MISSING
+        }
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 
 from .models import Todo, TodoGroup
 
@@ -8,13 +9,17 @@ class TodoGroupAdmin(admin.ModelAdmin):
     list_display = ["name", "owner", "todos_count", "created_at", "updated_at"]
     list_filter = ["created_at", "updated_at", "owner"]
     search_fields = ["name", "description", "owner__username", "owner__email"]
+    list_select_related = ["owner"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
 
-    def todos_count(self, obj):
-        return obj.todos.count()
+    def get_queryset(self, request):
+        # Count todos in the changelist query instead of once per row
+        return super().get_queryset(request).annotate(_todos_count=Count("todos"))
 
-    todos_count.short_description = "Todos Count"
+    @admin.display(description="Todos", ordering="_todos_count")
+    def todos_count(self, obj):
+        return obj._todos_count
 
 
 @admin.register(Todo)
@@ -22,4 +27,5 @@ class TodoAdmin(admin.ModelAdmin):
     list_display = ["title", "group", "is_completed", "created_at", "updated_at"]
     list_filter = ["created_at", "updated_at", "is_completed", "group"]
     search_fields = ["title", "description", "group__name"]
+    list_select_related = ["group"]
     ordering = ["-created_at"]
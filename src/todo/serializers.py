@@ -24,7 +24,11 @@ class TodoGroupSerializer(serializers.ModelSerializer):
         read_only_fields = ["owner", "created_at", "updated_at"]
 
     def get_todos_count(self, obj):
-        return obj.todos.count()
+        # Annotated by TodoGroupViewSet; newly created groups aren't annotated
+        count = getattr(obj, "_todos_count", None)
+        if count is None:
+            count = obj.todos.count()
+        return count
 
 
 class TodoSerializer(serializers.ModelSerializer):
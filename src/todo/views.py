@@ -1,3 +1,4 @@
+from django.db.models import Count
 from rest_framework import permissions, status, viewsets
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.filters import SearchFilter
@@ -11,7 +12,12 @@ class TodoGroupViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return TodoGroup.objects.filter(owner=self.request.user)
+        # Aggregating drops Meta.ordering, so the ordering is restated here
+        return (
+            TodoGroup.objects.filter(owner=self.request.user)
+            .annotate(_todos_count=Count("todos"))
+            .order_by("-created_at")
+        )
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
@@ -37,9 +43,11 @@ class TodoViewSet(viewsets.ModelViewSet):
     filter_backends = [SearchFilter]
 
     def get_queryset(self):
-        # Only return todos that belong to groups owned by the current user
-        user_groups = TodoGroup.objects.filter(owner=self.request.user)
-        return Todo.objects.filter(group__in=user_groups, is_completed=False)
+        # Only return todos that belong to groups owned by the current user.
+        # group and its owner are read per todo (group_name, ownership checks)
+        return Todo.objects.select_related("group", "group__owner").filter(
+            group__owner=self.request.user, is_completed=False
+        )
 
     def perform_create(self, serializer):
         group = serializer.validated_data.get("group")
@@ -52,7 +60,9 @@ class TodoViewSet(viewsets.ModelViewSet):
         serializer.save()
 
     def perform_update(self, serializer):
-        group = serializer.validated_data.get("group")
+        # Partial updates may leave out the group; the current one is
+        # already loaded by get_queryset's select_related
+        group = serializer.validated_data.get("group", serializer.instance.group)
         # Validate that the group belongs to the current user
         if group.owner != self.request.user:
             raise PermissionDenied(